@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import functools
-import inspect
+import sys
 import threading
 import typing
 
@@ -23,6 +23,11 @@ if typing.TYPE_CHECKING:
 # because it appears in function signatures in API reference (see docs).
 _unset = object()
 
+# Missing is a sentinel object that's passed as a default value to Box.get()
+# in order to tell a missing key without catching KeyError. It can't be
+# "_unset" because passing "_unset" means passing no default value at all.
+_missing = object()
+
 
 class Box:
     """Box is a dependency injection (DI) container.
@@ -52,9 +57,9 @@ class Box:
     """
 
     def __init__(self) -> None:
-        self._store: dict[Hashable, tuple[_scopes.Scope, Callable[[], Any]]] = {}
+        self._store: dict[Hashable, tuple[_scopes.Scope | None, Callable[[], Any]]] = {}
         self._scope_instances: dict[type[_scopes.Scope], _scopes.Scope] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
 
     def put(
         self,
@@ -80,7 +85,8 @@ class Box:
         :param factory: A factory function to produce a dependency when needed.
             Must be callable with no arguments.
         :param scope: A scope to keep track of produced dependencies. Must be
-            a class that implements :class:`Scope` interface.
+            a class that implements :class:`Scope` interface. See :meth:`.get`
+            on how `factory` is called for scoped dependencies.
         :raises ValueError: If both `value` and `factory` are passed.
         """
         if value is _unset and factory is None:
@@ -115,21 +121,38 @@ class Box:
         elif scope is None:
             scope = _scopes.noscope
 
+        # "No Scope" scope never keeps produced instances, so there's no
+        # point in asking it for one each time a dependency is retrieved.
+        # Such dependencies are stored without scope instance, and Box calls
+        # their factory functions directly.
+        scope_instance: _scopes.Scope | None
+        if scope is _scopes.noscope:
+            scope_instance = None
+
         # Convert a given scope class into a scope instance. Since key
         # is uniquely defined among all scopes within the same box, it's
         # safe to reuse already created scope instance in order to avoid
         # memory consumption when a lot of objects with the same scope
         # are put into a box.
-        try:
-            scope_instance = self._scope_instances[scope]
-        except KeyError:
-            scope_instance = self._scope_instances.setdefault(scope, scope())
-
-        # Despite "dict" is thread-safe in CPython (due to GIL), it's not
-        # guaranteed by the language itself and may not be the case among
-        # alternative implementations.
-        with self._lock:
-            self._store[key] = (scope_instance, factory)
+        else:
+            try:
+                scope_instance = self._scope_instances[scope]
+            except KeyError:
+                scope_instance = self._scope_instances.setdefault(scope, scope())
+
+        # String literals that look like identifiers are interned by Python,
+        # yet keys put into a box may be built at runtime. Interning them too
+        # lets lookups by such literals succeed on identity check, without
+        # comparing strings. Subclasses of str can't be interned, hence the
+        # exact type check.
+        if type(key) is str:
+            key = sys.intern(key)
+
+        # A single item assignment is atomic in CPython (both with and without
+        # GIL) and PyPy, so no lock is needed here. The lock is used by
+        # Box.get() only, where it guards re-checking a scope for a produced
+        # instance and storing one there.
+        self._store[key] = (scope_instance, factory)
 
     def get(self, key: Hashable, default: Any = _unset) -> Any:
         """Retrieve a dependency (aka service) out of the box instance.
@@ -139,6 +162,13 @@ class Box:
         caller code. If a dependency is `scoped`, there's a chance for an
         existing instance to be returned instead.
 
+        A `factory` function is called without holding any locks, so slow
+        factories don't stall other threads. As a consequence, if a scoped
+        dependency is requested concurrently for the first time, the `factory`
+        may be called more than once. All callers receive the same instance,
+        the one that was stored first, while other produced instances are
+        discarded without any cleanup.
+
         :param key: A key to retrieve a dependency. Must be the one used when
             calling :meth:`.put` method.
         :param default: (optional) A fallback value to be returned if there's
@@ -155,19 +185,32 @@ class Box:
                 raise
             return default
 
+        # Unscoped dependencies are produced each time they are requested, so
+        # there's nothing to look up and nothing to guard with the lock.
+        if scope is None:
+            return factory()
+
         # If something was put into a box under "key", Box tries to retrieve a
         # value. If it does not exist for current execution context, Box uses a
-        # factory function to create one. For implementation details below
-        # please refer to double-checked locking design pattern.
+        # factory function to create one.
         try:
-            value = scope.get(key)
+            return scope.get(key)
         except KeyError:
-            with self._lock:
-                try:
-                    value = scope.get(key)
-                except KeyError:
-                    value = factory()
-                    scope.set(key, value)
+            pass
+
+        # Factories may be slow (e.g. connect to a database), so they are
+        # called without holding the lock; otherwise every other thread that
+        # produces a dependency from this box would be stalled. The lock only
+        # guards storing the produced value: if another thread has stored one
+        # in the meantime, it's returned instead, so that everyone within the
+        # scope ends up with the same instance.
+        value = factory()
+
+        with self._lock:
+            try:
+                value = scope.get(key)
+            except KeyError:
+                scope.set(key, value)
 
         return value
 
@@ -191,29 +234,57 @@ class Box:
             a function argument named `as_`. If not passed, the same as `key`.
         :raises KeyError: If no dependencies saved under `key` in the box.
         """
+        # The name of an argument to bind a dependency to is known up front,
+        # so it's resolved once rather than each time a function is called.
+        # The same goes for the method to retrieve a dependency with, which is
+        # kept along since squashed dependencies may come from different boxes.
+        # If 'as_' is not passed, the key itself names the argument, which is
+        # only possible for string keys.
+        name = typing.cast("str", key) if as_ is None else as_
+        dependency = (self.get, key, name)
 
         def decorator(fn: Callable[P, R[T]]) -> Callable[P, R[T]]:
+            # The 'inspect' module is quite heavy to import, and it's needed
+            # for pass_() only. Importing it here saves a few milliseconds of
+            # import time for those who don't use the decorator, while others
+            # pay a cost of one 'sys.modules' lookup per decoration.
+            import inspect
+
             # If pass_ decorator is called second time (or more), we can squash
             # the calls into one and reduce runtime costs of injection.
-            if hasattr(fn, "__dependencies__"):
-                fn.__dependencies__.append((key, as_))
+            squashed_dependencies = getattr(fn, "__dependencies__", None)
+            if squashed_dependencies is not None:
+                squashed_dependencies.append(dependency)
                 return fn
 
+            # Inspecting a signature is expensive, so it's done once when the
+            # decorator is applied rather than each time the function is called.
+            # What we need to know at call time is whether an argument has been
+            # passed positionally, which boils down to comparing its position
+            # with the number of passed positional arguments.
+            positional_kinds = {
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            }
+            positions = {
+                name: position
+                for position, (name, parameter) in enumerate(
+                    inspect.signature(fn).parameters.items(),
+                )
+                if parameter.kind in positional_kinds
+            }
+
             @functools.wraps(fn)
             def fn_with_dependencies(*args: P.args, **kwargs: P.kwargs) -> R[T]:
-                signature = inspect.signature(fn)
-                arguments = signature.bind_partial(*args, **kwargs)
-
-                for key, as_ in wrapper.__dependencies__:  # type: ignore[attr-defined]
-                    if as_ is None:
-                        as_ = key
+                nargs = len(args)
 
+                for get, key, name in dependencies:
                     # One of picobox core principles is to supply dependencies
                     # if and only if they weren't passed explicitly by the
                     # caller code. A rationale behind is to be compatible with
                     # calls written prior picobox integration.
-                    if as_ not in arguments.arguments:
-                        kwargs[as_] = self.get(key)
+                    if name not in kwargs and positions.get(name, nargs) >= nargs:
+                        kwargs[name] = get(key)
                 return fn(*args, **kwargs)
 
             if inspect.iscoroutinefunction(fn):
@@ -225,7 +296,8 @@ class Box:
             else:
                 wrapper = fn_with_dependencies  # type: ignore[assignment]
 
-            wrapper.__dependencies__ = [(key, as_)]  # type: ignore[attr-defined]
+            dependencies: list[tuple[Callable[[Hashable], Any], Hashable, str]] = [dependency]
+            wrapper.__dependencies__ = dependencies  # type: ignore[attr-defined]
             return wrapper
 
         return decorator
@@ -280,11 +352,12 @@ class ChainBox(Box):
 
     def get(self, key: Hashable, default: Any = _unset) -> Any:
         """Same as :meth:`Box.get` but looks up for key in underlying boxes."""
+        # Underlying boxes are asked to return a sentinel for missing keys, so
+        # no KeyError is propagated and caught for each box that misses it.
         for box in self._boxes:
-            try:
-                return box.get(key)
-            except KeyError:
-                pass
+            value = box.get(key, _missing)
+            if value is not _missing:
+                return value
 
         if default is _unset:
             raise KeyError(key)
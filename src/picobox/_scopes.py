@@ -6,7 +6,6 @@ import abc
 import contextvars as _contextvars
 import threading
 import typing
-import weakref
 
 
 if typing.TYPE_CHECKING:
@@ -29,6 +28,12 @@ class Scope(metaclass=abc.ABCMeta):
     See corresponding methods for details below.
     """
 
+    # Scope instances are created once per box and scope class, yet they are
+    # accessed on each dependency retrieval. Builtin scopes declare slots to
+    # speed up attribute access, which is only possible if the base class
+    # does not bring instance dictionary on its own.
+    __slots__ = ()
+
     @abc.abstractmethod
     def set(self, key: Hashable, value: Any) -> None:
         """Bind `value` to `key` in current execution context."""
@@ -41,6 +46,8 @@ class Scope(metaclass=abc.ABCMeta):
 class singleton(Scope):
     """Share instances across application."""
 
+    __slots__ = ("_store",)
+
     def __init__(self) -> None:
         self._store: dict[Hashable, Any] = {}
 
@@ -54,6 +61,8 @@ class singleton(Scope):
 class threadlocal(Scope):
     """Share instances across the same thread."""
 
+    __slots__ = ("_local",)
+
     def __init__(self) -> None:
         self._local = threading.local()
 
@@ -84,20 +93,20 @@ class contextvars(Scope):
     .. versionadded:: 2.1
     """
 
-    _store_obj: weakref.WeakKeyDictionary[Scope, dict[Hashable, _contextvars.ContextVar[Any]]]
-    _store_obj = weakref.WeakKeyDictionary()
+    __slots__ = ("_store",)
 
-    @property
-    def _store(self) -> dict[Hashable, _contextvars.ContextVar[Any]]:
-        try:
-            scope_store = self._store_obj[self]
-        except KeyError:
-            scope_store = self._store_obj[self] = {}
-        return scope_store
+    def __init__(self) -> None:
+        self._store: dict[Hashable, _contextvars.ContextVar[Any]] = {}
 
     def set(self, key: Hashable, value: Any) -> None:
-        self._store[key] = _contextvars.ContextVar(str(key))
-        self._store[key].set(value)
+        # A context variable must be created once per key and then reused.
+        # Replacing it would drop values set for the key in other execution
+        # contexts, making them produce new instances for no reason.
+        try:
+            var = self._store[key]
+        except KeyError:
+            var = self._store.setdefault(key, _contextvars.ContextVar(str(key)))
+        var.set(value)
 
     def get(self, key: Hashable) -> Any:
         try:
@@ -109,6 +118,8 @@ class contextvars(Scope):
 class noscope(Scope):
     """Do not share instances, create them each time on demand."""
 
+    __slots__ = ()
+
     def set(self, key: Hashable, value: Any) -> None:
         pass
 
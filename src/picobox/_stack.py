@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-import contextlib
-import threading
+import collections
 import typing
 
 from ._box import Box, ChainBox, _unset
 
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Generator, Hashable
+    from collections.abc import Awaitable, Callable, Hashable
     from contextlib import AbstractContextManager
     from typing import Any, ParamSpec, TypeVar, Union
 
@@ -21,41 +20,32 @@ if typing.TYPE_CHECKING:
     R = Union[T | Awaitable[T]]
 
 _ERROR_MESSAGE_EMPTY_STACK = "No boxes found on the stack, please `.push()` a box first."
+_ERROR_MESSAGE_WRONG_POP = (
+    "The .push() context manager has popped the wrong Box instance, "
+    "meaning it did not pop the one that was pushed. This could "
+    "occur if the .push() context manager is manipulated manually "
+    "instead of using the 'with' statement."
+)
 
 
-@contextlib.contextmanager
-def _create_push_context_manager(
-    box: Box,
-    pop_callback: Callable[[], Box],
-) -> Generator[Box, None, None]:
-    """Create a context manager that calls something on exit."""
-    try:
-        yield box
-    finally:
-        if pop_callback() is not box:
-            error_message = (
-                "The .push() context manager has popped the wrong Box instance, "
-                "meaning it did not pop the one that was pushed. This could "
-                "occur if the .push() context manager is manipulated manually "
-                "instead of using the 'with' statement."
-            )
-            raise RuntimeError(error_message) from None
+class _PushContextManager:
+    """A context manager that pops a pushed box on exit."""
 
+    # The context manager is created on each push, so it's kept as lean as
+    # possible: no generator frame like @contextlib.contextmanager would
+    # create, and no instance dictionary.
+    __slots__ = ("_box", "_pop_callback")
 
-class _CurrentBoxProxy(Box):
-    """Delegates operations to the Box instance at the top of the stack."""
+    def __init__(self, box: Box, pop_callback: Callable[[], Box]) -> None:
+        self._box = box
+        self._pop_callback = pop_callback
 
-    def __init__(self, stack: list[Box]) -> None:
-        self._stack = stack
+    def __enter__(self) -> Box:
+        return self._box
 
-    def __getattribute__(self, name: str) -> Any:
-        if name == "_stack":
-            return super().__getattribute__(name)
-
-        try:
-            return getattr(self._stack[-1], name)
-        except IndexError:
-            raise RuntimeError(_ERROR_MESSAGE_EMPTY_STACK) from None
+    def __exit__(self, *exc_info: object) -> None:
+        if self._pop_callback() is not self._box:
+            raise RuntimeError(_ERROR_MESSAGE_WRONG_POP) from None
 
 
 class Stack:
@@ -103,19 +93,16 @@ class Stack:
     """
 
     def __init__(self, name: str | None = None) -> None:
-        self._name = name or f"0x{id(self):x}"
-        self._stack: list[Box] = []
-        self._lock = threading.Lock()
-
-        # A proxy object that proxies all calls to a box instance on the top
-        # of the stack. We need such an object to provide a set of functions
-        # that mimic Box interface but deal with a box on the top instead.
-        # While it's not completely necessary for `put()` and `get()`, it's
-        # crucial for `pass_()` due to its laziness and thus late evaluation.
-        self._current_box = _CurrentBoxProxy(self._stack)
+        self._name = name
+        # Boxes are only ever added to and removed from the top of the stack,
+        # and only the top one is ever looked at. A deque is a bit faster
+        # than a list for this access pattern.
+        self._stack: collections.deque[Box] = collections.deque()
 
     def __repr__(self) -> str:
-        return f"<Stack ({self._name})>"
+        # The fallback name is only needed for representation, so there's no
+        # point in formatting it each time a stack is created.
+        return f"<Stack ({self._name or f'0x{id(self):x}'})>"
 
     def push(self, box: Box, *, chain: bool = False) -> AbstractContextManager[Box]:
         """Push a :class:`Box` instance to the top of the stack.
@@ -130,15 +117,20 @@ class Stack:
             To look up through multiple levels, each level must be created with
             this option set to ``True``.
         """
-        # list.append() is a thread-safe operation in CPython, yet the safety
-        # is not guaranteed by the language itself. So the lock is used here to
-        # ensure the code works properly even when running on alternative
-        # implementations.
-        with self._lock:
-            if chain and self._stack:
-                box = ChainBox(box, self._stack[-1])
-            self._stack.append(box)
-        return _create_push_context_manager(self._stack[-1], self._stack.pop)
+        # Unlike list operations, deque.append() and deque.pop() are
+        # documented to be thread-safe, so no lock is needed to guard the
+        # stack, regardless of Python implementation.
+        if chain and self._stack:
+            top = self._stack[-1]
+
+            # Chaining onto a ChainBox would nest one more ChainBox per push,
+            # and each lookup would have to recurse through all of them. Since
+            # ChainBox is merely a sequence of boxes to look up into, boxes of
+            # the top ChainBox are chained directly instead.
+            boxes = top._boxes if type(top) is ChainBox else (top,)  # noqa: SLF001
+            box = ChainBox(box, *boxes)
+        self._stack.append(box)
+        return _PushContextManager(box, self._stack.pop)
 
     def pop(self) -> Box:
         """Pop the box from the top of the stack.
@@ -156,15 +148,10 @@ class Stack:
         :return: a removed box
         :raises IndexError: If the stack is empty and there's nothing to pop.
         """
-        # list.append() is a thread-safe operation in CPython, yet the safety
-        # is not guaranteed by the language itself. So the lock is used here to
-        # ensure the code works properly even when running on alternative
-        # implementations.
-        with self._lock:
-            try:
-                return self._stack.pop()
-            except IndexError:
-                raise RuntimeError(_ERROR_MESSAGE_EMPTY_STACK) from None
+        try:
+            return self._stack.pop()
+        except IndexError:
+            raise RuntimeError(_ERROR_MESSAGE_EMPTY_STACK) from None
 
     def put(
         self,
@@ -175,11 +162,19 @@ class Stack:
         scope: type[Scope] | None = None,
     ) -> None:
         """The same as :meth:`Box.put` but for a box at the top of the stack."""
-        return self._current_box.put(key, value, factory=factory, scope=scope)
+        try:
+            box = self._stack[-1]
+        except IndexError:
+            raise RuntimeError(_ERROR_MESSAGE_EMPTY_STACK) from None
+        return box.put(key, value, factory=factory, scope=scope)
 
     def get(self, key: Hashable, default: Any = _unset) -> Any:
         """The same as :meth:`Box.get` but for a box at the top."""
-        return self._current_box.get(key, default=default)
+        try:
+            box = self._stack[-1]
+        except IndexError:
+            raise RuntimeError(_ERROR_MESSAGE_EMPTY_STACK) from None
+        return box.get(key, default)
 
     def pass_(
         self,
@@ -188,7 +183,11 @@ class Stack:
         as_: str | None = None,
     ) -> Callable[[Callable[P, R[T]]], Callable[P, R[T]]]:
         """The same as :meth:`Box.pass_` but for a box at the top."""
-        return Box.pass_(self._current_box, key, as_=as_)
+        # Box.pass_() relies on nothing but the `get()` method to retrieve
+        # dependencies, and it does so lazily, when a decorated function is
+        # called. Since `Stack.get()` looks up a box at the top of the stack
+        # on each call, the stack can be used in place of a box here.
+        return Box.pass_(self, key, as_=as_)  # type: ignore[arg-type]
 
 
 _instance = Stack("shared")
@@ -223,7 +222,7 @@ def put(
 
 def get(key: Hashable, default: Any = _unset) -> Any:
     """The same as :meth:`Stack.get` but for a shared stack instance."""
-    return _instance.get(key, default=default)
+    return _instance.get(key, default)
 
 
 def pass_(
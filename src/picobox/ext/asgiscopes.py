@@ -13,8 +13,8 @@ if typing.TYPE_CHECKING:
     from collections.abc import Awaitable, Callable, Hashable, MutableMapping
     from typing import Any
 
-    Store = weakref.WeakKeyDictionary[picobox.Scope, dict[Hashable, Any]]
-    StoreCtxVar = contextvars.ContextVar[Store]
+    Store = MutableMapping[picobox.Scope, dict[Hashable, Any]]
+    StoresCtxVar = contextvars.ContextVar[tuple[Store, Store]]
     ASGIScope = MutableMapping[str, Any]
     ASGIMessage = MutableMapping[str, Any]
     ASGIReceive = Callable[[], Awaitable[ASGIMessage]]
@@ -22,8 +22,10 @@ if typing.TYPE_CHECKING:
     ASGIApplication = Callable[[ASGIScope, ASGIReceive, ASGISend], Awaitable[None]]
 
 
-_current_app_store: StoreCtxVar = contextvars.ContextVar(f"{__name__}.current-app-store")
-_current_req_store: StoreCtxVar = contextvars.ContextVar(f"{__name__}.current-req-store")
+# Application and request stores are always set and reset together, so they
+# are kept in one context variable as a pair. This halves the number of
+# context variable operations performed per request.
+_current_stores: StoresCtxVar = contextvars.ContextVar(f"{__name__}.current-stores")
 
 
 class ScopeMiddleware:
@@ -55,25 +57,36 @@ class ScopeMiddleware:
         # applied once to a given ASGI application. By keeping the application
         # scope state in the middleware, we facilitate support for multiple
         # simultaneous ASGI applications (e.g., in nested execution scenarios).
-        app_store_token = _current_app_store.set(self.store)
-        req_store_token = _current_req_store.set(weakref.WeakKeyDictionary())
+        #
+        # Unlike the application store, the request store lives no longer than
+        # the request itself and is discarded afterwards along with everything
+        # it holds. Weakly referencing scope instances buys nothing there but
+        # a weak reference allocated per scope instance used in the request.
+        stores_token = _current_stores.set((self.store, {}))
 
         try:
             await self.app(scope, receive, send)
         finally:
-            _current_req_store.reset(req_store_token)
-            _current_app_store.reset(app_store_token)
+            _current_stores.reset(stores_token)
 
 
 class _asgiscope(picobox.Scope):
     """A base class for ASGI scopes."""
 
-    _store_cvar: StoreCtxVar
+    # Scope instances are weakly referenced by the store they keep their
+    # values in, hence "__weakref__" has to be declared among the slots.
+    __slots__ = ("__weakref__",)
 
-    @property
-    def _store(self) -> dict[Hashable, Any]:
+    # An index of a store within the current application and request stores
+    # pair to keep dependencies in.
+    _store_index: int
+
+    # Retrieving the store is a regular method rather than a property since
+    # it's called on each dependency retrieval, and calling a method is
+    # cheaper than going through the property descriptor.
+    def _get_store(self) -> dict[Hashable, Any]:
         try:
-            store = self._store_cvar.get()
+            stores = _current_stores.get()
         except LookupError:
             error_message = (
                 "Working outside of ASGI context.\n"
@@ -84,6 +97,7 @@ class _asgiscope(picobox.Scope):
             )
             raise RuntimeError(error_message) from None
 
+        store = stores[self._store_index]
         try:
             scope_store = store[self]
         except KeyError:
@@ -91,10 +105,10 @@ class _asgiscope(picobox.Scope):
         return scope_store
 
     def set(self, key: Hashable, value: Any) -> None:
-        self._store[key] = value
+        self._get_store()[key] = value
 
     def get(self, key: Hashable) -> Any:
-        return self._store[key]
+        return self._get_store()[key]
 
 
 class application(_asgiscope):
@@ -112,7 +126,9 @@ class application(_asgiscope):
     .. versionadded:: 4.1
     """
 
-    _store_cvar = _current_app_store
+    __slots__ = ()
+
+    _store_index = 0
 
 
 class request(_asgiscope):
@@ -127,4 +143,6 @@ class request(_asgiscope):
     .. versionadded:: 4.1
     """
 
-    _store_cvar = _current_req_store
+    __slots__ = ()
+
+    _store_index = 1
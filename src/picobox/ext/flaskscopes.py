@@ -11,9 +11,11 @@ import picobox
 
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Hashable
+    from collections.abc import Callable, Hashable
     from typing import Any
 
+    from werkzeug.local import LocalProxy
+
     class _flask_store_obj(typing.Protocol):
         __dependencies__: weakref.WeakKeyDictionary[picobox.Scope, dict[Hashable, Any]]
 
@@ -21,15 +23,30 @@ if typing.TYPE_CHECKING:
 class _flaskscope(picobox.Scope):
     """A base class for Flask scopes."""
 
-    def __init__(self, store_obj: object) -> None:
-        self._store_obj = typing.cast("_flask_store_obj", store_obj)
+    # Scope instances are weakly referenced by the store they keep their
+    # values in, hence "__weakref__" has to be declared among the slots.
+    __slots__ = ("__weakref__", "_get_store_obj")
+
+    def __init__(self, store_obj: LocalProxy[Any]) -> None:
+        # Flask exposes 'current_app' and 'g' as context-local proxies, and
+        # each attribute access on a proxy costs a context lookup followed by
+        # a lookup on the proxied object. Resolving the proxied object once
+        # per access and working with it directly is a few times faster.
+        # Please note, Flask annotates its proxies as proxied objects, hence
+        # type checkers have to be silenced when passing them in.
+        self._get_store_obj = typing.cast(
+            "Callable[[], _flask_store_obj]",
+            store_obj._get_current_object,  # noqa: SLF001
+        )
 
     @property
     def _store(self) -> dict[Hashable, Any]:
+        store_obj = self._get_store_obj()
+
         try:
-            store = self._store_obj.__dependencies__
+            store = store_obj.__dependencies__
         except AttributeError:
-            store = self._store_obj.__dependencies__ = weakref.WeakKeyDictionary()
+            store = store_obj.__dependencies__ = weakref.WeakKeyDictionary()
 
         try:
             scope_store = store[self]
@@ -62,8 +79,10 @@ class application(_flaskscope):
     .. versionadded:: 2.2
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
-        super().__init__(flask.current_app)
+        super().__init__(flask.current_app)  # type: ignore[arg-type]
 
 
 class request(_flaskscope):
@@ -79,5 +98,7 @@ class request(_flaskscope):
     .. versionadded:: 2.2
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
-        super().__init__(flask.g)
+        super().__init__(flask.g)  # type: ignore[arg-type]
@@ -10,17 +10,19 @@ import picobox
 
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Hashable, Iterable
+    from collections.abc import Hashable, Iterable, MutableMapping
     from typing import Any
 
     from _typeshed.wsgi import StartResponse, WSGIApplication, WSGIEnvironment
 
-    Store = weakref.WeakKeyDictionary[picobox.Scope, dict[Hashable, Any]]
-    StoreCtxVar = contextvars.ContextVar[Store]
+    Store = MutableMapping[picobox.Scope, dict[Hashable, Any]]
+    StoresCtxVar = contextvars.ContextVar[tuple[Store, Store]]
 
 
-_current_app_store: StoreCtxVar = contextvars.ContextVar(f"{__name__}.current-app-store")
-_current_req_store: StoreCtxVar = contextvars.ContextVar(f"{__name__}.current-req-store")
+# Application and request stores are always set and reset together, so they
+# are kept in one context variable as a pair. This halves the number of
+# context variable operations performed per request.
+_current_stores: StoresCtxVar = contextvars.ContextVar(f"{__name__}.current-stores")
 
 
 class ScopeMiddleware:
@@ -56,26 +58,37 @@ class ScopeMiddleware:
         # applied once to a given WSGI application. By keeping the application
         # scope state in the middleware, we facilitate support for multiple
         # simultaneous WSGI applications (e.g., in nested execution scenarios).
-        app_store_token = _current_app_store.set(self.store)
-        req_store_token = _current_req_store.set(weakref.WeakKeyDictionary())
+        #
+        # Unlike the application store, the request store lives no longer than
+        # the request itself and is discarded afterwards along with everything
+        # it holds. Weakly referencing scope instances buys nothing there but
+        # a weak reference allocated per scope instance used in the request.
+        stores_token = _current_stores.set((self.store, {}))
 
         try:
             rv = self.app(environ, start_response)
         finally:
-            _current_req_store.reset(req_store_token)
-            _current_app_store.reset(app_store_token)
+            _current_stores.reset(stores_token)
         return rv
 
 
 class _wsgiscope(picobox.Scope):
     """A base class for WSGI scopes."""
 
-    _store_cvar: StoreCtxVar
+    # Scope instances are weakly referenced by the store they keep their
+    # values in, hence "__weakref__" has to be declared among the slots.
+    __slots__ = ("__weakref__",)
 
-    @property
-    def _store(self) -> dict[Hashable, Any]:
+    # An index of a store within the current application and request stores
+    # pair to keep dependencies in.
+    _store_index: int
+
+    # Retrieving the store is a regular method rather than a property since
+    # it's called on each dependency retrieval, and calling a method is
+    # cheaper than going through the property descriptor.
+    def _get_store(self) -> dict[Hashable, Any]:
         try:
-            store = self._store_cvar.get()
+            stores = _current_stores.get()
         except LookupError:
             error_message = (
                 "Working outside of WSGI context.\n"
@@ -86,6 +99,7 @@ class _wsgiscope(picobox.Scope):
             )
             raise RuntimeError(error_message) from None
 
+        store = stores[self._store_index]
         try:
             scope_store = store[self]
         except KeyError:
@@ -93,10 +107,10 @@ class _wsgiscope(picobox.Scope):
         return scope_store
 
     def set(self, key: Hashable, value: Any) -> None:
-        self._store[key] = value
+        self._get_store()[key] = value
 
     def get(self, key: Hashable) -> Any:
-        return self._store[key]
+        return self._get_store()[key]
 
 
 class application(_wsgiscope):
@@ -114,7 +128,9 @@ class application(_wsgiscope):
     .. versionadded:: 4.1
     """
 
-    _store_cvar = _current_app_store
+    __slots__ = ()
+
+    _store_index = 0
 
 
 class request(_wsgiscope):
@@ -129,4 +145,6 @@ class request(_wsgiscope):
     .. versionadded:: 4.1
     """
 
-    _store_cvar = _current_req_store
+    __slots__ = ()
+
+    _store_index = 1
@@ -1,10 +1,13 @@
 """Test picobox class."""
 
 import collections
+import concurrent.futures
 import inspect
 import itertools
 import sys
+import threading
 import traceback
+import weakref
 
 import pytest
 
@@ -96,6 +99,24 @@ def test_box_put_factory_dependency(boxclass):
     assert testbox.get("b") == 14
 
 
+def test_box_put_factory_singleton_scope_concurrent(boxclass):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def factory():
+        barrier.wait()
+        return object()
+
+    testbox = boxclass()
+    testbox.put("the-key", factory=factory, scope=picobox.singleton)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(testbox.get, "the-key") for _ in range(2)]
+        objects = [future.result() for future in futures]
+
+    assert objects[0] is objects[1]
+    assert testbox.get("the-key") is objects[0]
+
+
 def test_box_put_value_factory_required(boxclass):
     testbox = boxclass()
 
@@ -141,6 +162,14 @@ def test_box_get_default(boxclass):
     assert testbox.get("the-key", default) is default
 
 
+def test_box_weakref(boxclass):
+    testbox = boxclass()
+    testbox.the_attribute = 42
+
+    assert weakref.ref(testbox)() is testbox
+    assert testbox.the_attribute == 42
+
+
 @pytest.mark.parametrize(
     ("args", "kwargs", "rv"),
     [
@@ -366,6 +395,50 @@ def test_box_pass_d_as_b(boxclass, args, kwargs, rv):
     assert fn(*args, **kwargs) == rv
 
 
+@pytest.mark.parametrize(
+    ("args", "kwargs", "rv"),
+    [
+        ((1,), {"b": 2, "c": 3}, 6),
+        ((1,), {"c": 3}, 14),
+        ((), {"a": 1, "b": 2}, 13),
+        ((), {"a": 1}, 21),
+    ],
+)
+def test_box_pass_keyword_only(boxclass, args, kwargs, rv):
+    testbox = boxclass()
+    testbox.put("b", 10)
+    testbox.put("c", 10)
+
+    @testbox.pass_("b")
+    @testbox.pass_("c")
+    def fn(a, *, b, c):
+        return a + b + c
+
+    assert fn(*args, **kwargs) == rv
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs", "rv"),
+    [
+        ((1,), {"b": 2, "c": 3}, {"b": 2, "c": 3}),
+        ((1,), {"c": 3}, {"b": 10, "c": 3}),
+        ((1,), {"b": 2}, {"b": 2, "c": 10}),
+        ((1,), {}, {"b": 10, "c": 10}),
+    ],
+)
+def test_box_pass_var_keyword(boxclass, args, kwargs, rv):
+    testbox = boxclass()
+    testbox.put("b", 10)
+    testbox.put("c", 10)
+
+    @testbox.pass_("b")
+    @testbox.pass_("c")
+    def fn(a, **kwargs):
+        return kwargs
+
+    assert fn(*args, **kwargs) == rv
+
+
 @pytest.mark.parametrize(
     ("args", "kwargs", "rv"),
     [
@@ -508,6 +581,31 @@ def test_box_pass_optimization_complex(request, boxclass):
     assert len(fn()) == 3
 
 
+def test_box_pass_optimization_multiple_boxes(request, boxclass):
+    testbox_a = boxclass()
+    testbox_a.put("a", 1)
+    testbox_a.put("b", 1)
+
+    testbox_b = boxclass()
+    testbox_b.put("b", 2)
+
+    @testbox_a.pass_("a")
+    @testbox_b.pass_("b")
+    def fn(a, b):
+        backtrace = list(
+            itertools.dropwhile(
+                lambda frame: frame[2] != request.function.__name__,
+                traceback.extract_stack(),
+            ),
+        )
+        return a, b, backtrace[1:-1]
+
+    a, b, backtrace = fn()
+
+    assert (a, b) == (1, 2)
+    assert len(backtrace) == 1
+
+
 @pytest.mark.asyncio
 async def test_box_pass_optimization_async(request, boxclass):
     testbox = boxclass()
@@ -556,6 +654,24 @@ def test_chainbox_get_chained():
     assert testchainbox.get("the-pin") == 12
 
 
+def test_chainbox_get_factory_keyerror():
+    def factory():
+        error_message = "the-pin"
+        raise KeyError(error_message)
+
+    testbox_a = picobox.Box()
+    testbox_a.put("the-key", factory=factory)
+
+    testbox_b = picobox.Box()
+    testbox_b.put("the-key", 13)
+
+    testchainbox = picobox.ChainBox(testbox_a, testbox_b)
+
+    with pytest.raises(KeyError) as excinfo:
+        testchainbox.get("the-key")
+    assert str(excinfo.value) == "'the-pin'"
+
+
 def test_chainbox_isinstance_box():
     assert isinstance(picobox.ChainBox(), picobox.Box)
 
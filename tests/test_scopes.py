@@ -311,6 +311,26 @@ def test_scope_value_upstack_not_shared(scope_factory, run):
     assert str(excinfo.value) == "'the-key'"
 
 
+@pytest.mark.parametrize(
+    ("scope_factory", "run"),
+    [
+        (picobox.threadlocal, run_in_thread),
+        (picobox.contextvars, run_in_thread),
+        (picobox.contextvars, run_in_event_loop),
+        (picobox.contextvars, run_in_context),
+    ],
+)
+def test_scope_value_kept_when_set_elsewhere(scope_factory, run):
+    scope = scope_factory()
+    value_a = object()
+    value_b = object()
+
+    scope.set("the-key", value_a)
+    run(scope.set, "the-key", value_b)
+
+    assert scope.get("the-key") is value_a
+
+
 @pytest.mark.parametrize(
     ("scope_factory", "run"),
     [
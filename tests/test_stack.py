@@ -5,6 +5,7 @@ import inspect
 import itertools
 import sys
 import traceback
+import weakref
 
 import pytest
 
@@ -738,3 +739,35 @@ def test_stack_pop_runtimeerror(teststack):
         teststack.pop()
 
     assert str(excinfo.value) == "No boxes found on the stack, please `.push()` a box first."
+
+
+def test_stack_push_pop_wrong_box(boxclass, teststack):
+    foobox = boxclass()
+    barbox = boxclass()
+
+    context_manager = teststack.push(foobox)
+    teststack.push(barbox)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        with context_manager:
+            pass
+
+    assert str(excinfo.value).startswith(
+        "The .push() context manager has popped the wrong Box instance"
+    )
+    assert teststack.pop() is foobox
+
+
+def test_stack_repr():
+    assert repr(picobox.Stack("the-name")) == "<Stack (the-name)>"
+
+    teststack = picobox.Stack()
+    assert repr(teststack) == f"<Stack (0x{id(teststack):x})>"
+
+
+def test_stack_weakref():
+    teststack = picobox.Stack()
+    teststack.the_attribute = 42
+
+    assert weakref.ref(teststack)() is teststack
+    assert teststack.the_attribute == 42